@@ -4,27 +4,43 @@ from tkinter import ttk
 import tkinter.messagebox as messagebox
 import json
 import os
+import hashlib
+import operator
+import functools
+import logging
+import atexit
+import stat
 import threading
+import time
 import urllib.request
 import urllib.parse
 import urllib.error
-from datetime import datetime
+from datetime import datetime, timezone
 from pathlib import Path
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, Future
 from typing import List, Optional, Dict, Any
 import re
 import tempfile
+import shutil
 import http.server
-import socketserver
+import http.client
+import io
+import base64
+import mmap
 from urllib.parse import urlparse, parse_qs
 import socket
-import subprocess
 try:
     import webview
     HAS_WEBVIEW = True
 except ImportError:
     HAS_WEBVIEW = False
-    import webbrowser
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
 
 # Canvas Notes Dashboard
 # Updated to only download new exe when applicable and HTML file with embedded CSS
@@ -33,6 +49,169 @@ except ImportError:
 APP_VERSION = "0.0.0"
 DEV_MODE = False
 
+# Per-request tracing goes through this logger; it is only enabled in dev mode (see main)
+log = logging.getLogger("canvas_dashboard")
+
+# Patterns used by CanvasAPI.extract_term, compiled once at import
+_TERM_RE = re.compile(r'(Fall|Spring|Summer|Winter)\s*(\d{4})', re.IGNORECASE)
+_YEAR_RE = re.compile(r'(\d{4})')
+_TERM_ID_RE = re.compile(r'Term:\s*(\d+)')
+# Anything that isn't a (Unicode) letter/digit, space, hyphen or underscore
+_UNSAFE_NAME_RE = re.compile(r'[^\w \-]+')
+
+# Content types for files served from the src folder
+_CONTENT_TYPES = {
+    '.html': 'text/html',
+    '.css': 'text/css',
+    '.js': 'application/javascript',
+    '.json': 'application/json',
+    '.svg': 'image/svg+xml',
+    '.woff2': 'font/woff2',
+}
+
+# src files at least this large are streamed with socket.sendfile instead of
+# being held in the in-memory src cache
+_SENDFILE_MIN_SIZE = 256 * 1024
+
+# Endpoints tried in order by check_internet_connection
+_CONNECTIVITY_PROBES = (("1.1.1.1", 53), ("api.github.com", 443))
+
+# Course notes larger than this are not loaded into the editor
+_NOTE_MAX_BYTES = 16 << 20
+
+# Total characters of decoded notes kept in memory; least recently used go first
+_NOTES_CACHE_MAX_CHARS = 8 << 20
+
+# Serializes read-merge-write of http_cache.json across CanvasAPI instances
+_HTTP_CACHE_LOCK = threading.Lock()
+
+# Redirects KeepAliveHTTPClient follows, and how many in a row
+_REDIRECT_STATUSES = frozenset((301, 302, 303, 307, 308))
+_MAX_REDIRECTS = 5
+
+# Smallest slice worth its own connection when downloading the update in parallel
+_RANGE_PART_MIN_SIZE = 1024 * 1024
+
+# Update-check summary lines, keyed on whether an update is available
+_APP_MSG = {
+    True: "App Update Available: {current} → {latest}",
+    False: "App: Up to date",
+}
+_SRC_MSG = {
+    True: "Interface Files: Update available",
+    False: "Interface Files: Up to date",
+}
+_SRC_DEV_MSG = "Interface Files: Dev mode (local files)"
+_NO_INFO = {}
+
+# Config writes closer together than this are coalesced into one
+_CONFIG_FLUSH_INTERVAL = 0.25
+
+# Standalone page written by create_minimal_src_folder when the download fails
+_FALLBACK_HTML_BYTES = """<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Canvas Notes Dashboard</title>
+    <style>
+        body { 
+            font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif; 
+            margin: 0; 
+            padding: 0; 
+            background: linear-gradient(135deg, #0f1419 0%, #1a2332 100%); 
+            color: white; 
+            min-height: 100vh;
+            display: flex;
+            align-items: center;
+            justify-content: center;
+        }
+        .container {
+            text-align: center;
+            padding: 50px;
+            background: rgba(30, 40, 50, 0.8);
+            border-radius: 12px;
+            box-shadow: 0 8px 32px rgba(0, 0, 0, 0.3);
+        }
+        h1 {
+            color: #4a9eff;
+            margin-bottom: 20px;
+            font-size: 2.5rem;
+        }
+        p {
+            font-size: 1.2rem;
+            line-height: 1.6;
+            margin-bottom: 15px;
+        }
+        .status {
+            color: #ffc107;
+            font-weight: bold;
+        }
+    </style>
+</head>
+<body>
+    <div class="container">
+        <h1>🎓 Canvas Notes Dashboard</h1>
+        <p class="status">Minimal fallback mode</p>
+        <p>Please check your internet connection and try again.</p>
+        <p>The application will attempt to download the latest interface files when connectivity is restored.</p>
+    </div>
+</body>
+</html>""".encode('utf-8')
+
+def _json_dumps_bytes(data, indent: bool = False) -> bytes:
+    """Serialize to UTF-8 JSON (compact unless indent), using orjson when it is installed"""
+    if HAS_ORJSON:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else None)
+    if indent:
+        return json.dumps(data, indent=2).encode('utf-8')
+    return json.dumps(data, separators=(',', ':')).encode('utf-8')
+
+def _json_loads(data: bytes) -> Any:
+    """Parse UTF-8 JSON bytes, using orjson when it is installed"""
+    if HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
+
+@functools.lru_cache(maxsize=256)
+def _safe_course_name(course_name: str) -> str:
+    """Folder name for a course's notes: the name without filesystem-unsafe characters"""
+    return _UNSAFE_NAME_RE.sub('', course_name).rstrip()
+
+def _write_file_atomic(path: Path, data, encoding: Optional[str] = None):
+    """Write data (bytes, or str when encoding is given) to a sibling temp file and rename it over path.
+    
+    A crash mid-write leaves the previous file intact instead of a truncated one.
+    """
+    # Unique per thread, so concurrent writers of the same file never share a temp file
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}-{threading.get_ident()}.tmp")
+    try:
+        with open(tmp_path, 'w' if encoding else 'wb', encoding=encoding, buffering=1 << 20) as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+def _read_note_file(path: str, size: int) -> str:
+    """Read a note with raw os.read calls sized from its stat, decoded like open(path, 'r')"""
+    fd = os.open(path, os.O_RDONLY | getattr(os, 'O_BINARY', 0))
+    try:
+        if hasattr(os, 'posix_fadvise'):
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        chunks = []
+        while True:
+            # Normally one read returns the whole file; loop in case it grew since the stat
+            chunk = os.read(fd, max(size, 4096))
+            if not chunk:
+                break
+            chunks.append(chunk)
+    finally:
+        os.close(fd)
+    # Match text-mode reads: universal newlines, and bad bytes replaced instead of losing the note
+    text = b''.join(chunks).decode('utf-8', 'replace')
+    return text.replace('\r\n', '\n').replace('\r', '\n')
+
 class DevLogger:
     """Logger class for dev mode that saves console output to a log file"""
     def __init__(self, log_file_path):
@@ -43,8 +222,10 @@ class DevLogger:
         # Create log file and directory if they don't exist
         os.makedirs(os.path.dirname(log_file_path), exist_ok=True)
         
-        # Open log file in append mode
-        self.log_file = open(log_file_path, 'a', encoding='utf-8')
+        # Open log file in append mode, buffered and flushed periodically
+        self.log_file = open(log_file_path, 'a', encoding='utf-8', buffering=65536)
+        self._lock = threading.Lock()
+        self._stop_flushing = threading.Event()
         
         # Write session start marker
         self.log_file.write(f"\n{'='*50}\n")
@@ -52,43 +233,196 @@ class DevLogger:
         self.log_file.write(f"Canvas Dashboard v{APP_VERSION} - DEV MODE\n")
         self.log_file.write(f"{'='*50}\n")
         self.log_file.flush()
+        
+        threading.Thread(target=self._periodic_flush, daemon=True).start()
+        # Make sure buffered output reaches the file even if main() never gets to close()
+        atexit.register(self.close)
+    
+    def _periodic_flush(self):
+        while not self._stop_flushing.wait(1.0):
+            with self._lock:
+                if self.log_file:
+                    self.log_file.flush()
     
     def write(self, text):
         # Write to both console and log file
         self.original_stdout.write(text)
-        self.log_file.write(text)
-        self.log_file.flush()
+        self.write_log(text)
+    
+    def write_log(self, text, flush=False):
+        """Append text to the log file under the lock shared with the periodic flusher"""
+        with self._lock:
+            if self.log_file:
+                self.log_file.write(text)
+                if flush:
+                    self.log_file.flush()
     
     def flush(self):
         self.original_stdout.flush()
-        self.log_file.flush()
+        with self._lock:
+            if self.log_file:
+                self.log_file.flush()
     
     def close(self):
-        if hasattr(self, 'log_file') and self.log_file:
-            self.log_file.write(f"\nSession ended: {datetime.now().isoformat()}\n")
-            self.log_file.write(f"{'='*50}\n\n")
-            self.log_file.close()
+        self._stop_flushing.set()
+        with self._lock:
+            if self.log_file:
+                self.log_file.write(f"\nSession ended: {datetime.now().isoformat()}\n")
+                self.log_file.write(f"{'='*50}\n\n")
+                self.log_file.close()
+                self.log_file = None
         # Restore original stdout/stderr
         sys.stdout = self.original_stdout
         sys.stderr = self.original_stderr
 
 class DevErrorLogger:
-    """Error logger for stderr in dev mode"""
-    def __init__(self, log_file, original_stderr):
-        self.log_file = log_file
+    """Error logger for stderr in dev mode; writes through the DevLogger that owns the file"""
+    def __init__(self, dev_logger, original_stderr):
+        self.dev_logger = dev_logger
         self.original_stderr = original_stderr
     
     def write(self, text):
-        # Write to both console and log file
+        # Write to both console and log file; errors are flushed right away
         self.original_stderr.write(text)
-        self.log_file.write(f"[ERROR] {text}")
-        self.log_file.flush()
+        self.dev_logger.write_log(f"[ERROR] {text}", flush=True)
     
     def flush(self):
         self.original_stderr.flush()
-        self.log_file.flush()
+        self.dev_logger.write_log('', flush=True)
+
+class KeepAliveHTTPClient:
+    """Minimal HTTP(S) GET client that keeps one connection per host open between requests"""
+    
+    def __init__(self, headers: Optional[Dict[str, str]] = None):
+        self.headers = headers or {}
+        # host -> (connection, proxy headers, send absolute URL) as returned by _connect
+        self._connections: Dict[str, tuple] = {}
+        self._locks: Dict[str, threading.Lock] = {}
+        self._locks_guard = threading.Lock()
+    
+    def _host_lock(self, host: str) -> threading.Lock:
+        with self._locks_guard:
+            return self._locks.setdefault(host, threading.Lock())
+    
+    @staticmethod
+    def _proxy_for(parts) -> Optional[urllib.parse.SplitResult]:
+        """The proxy urlopen would use for this URL (environment or Windows registry), if any"""
+        proxy = urllib.request.getproxies().get(parts.scheme)
+        if not proxy or urllib.request.proxy_bypass(parts.hostname or ''):
+            return None
+        if '://' not in proxy:
+            proxy = 'http://' + proxy
+        return urllib.parse.urlsplit(proxy)
+    
+    def _connect(self, parts, timeout):
+        """Open a connection for parts; returns (connection, extra headers, whether to send the absolute URL)"""
+        proxy = self._proxy_for(parts)
+        if proxy is None:
+            connection_class = http.client.HTTPSConnection if parts.scheme == 'https' else http.client.HTTPConnection
+            return connection_class(parts.netloc, timeout=timeout), {}, False
+        
+        proxy_headers = {}
+        if proxy.username:
+            credentials = f"{urllib.parse.unquote(proxy.username)}:{urllib.parse.unquote(proxy.password or '')}"
+            proxy_headers['Proxy-Authorization'] = 'Basic ' + base64.b64encode(credentials.encode()).decode('ascii')
+        proxy_port = proxy.port or 80
+        if parts.scheme == 'https':
+            # CONNECT through the proxy, then TLS to the real host, as urllib does
+            conn = http.client.HTTPSConnection(proxy.hostname, proxy_port, timeout=timeout)
+            conn.set_tunnel(parts.hostname, parts.port or 443, headers=proxy_headers)
+            return conn, {}, False
+        return http.client.HTTPConnection(proxy.hostname, proxy_port, timeout=timeout), proxy_headers, True
+    
+    def _drop(self, host: str):
+        entry = self._connections.pop(host, None)
+        if entry:
+            entry[0].close()
+    
+    def get(self, url: str, headers: Optional[Dict[str, str]] = None, timeout: float = 10, sink=None):
+        """GET url over a reused connection; returns (status, headers, body).
+        
+        Redirects are followed like urlopen does. Anything that doesn't end in 200 or
+        304 raises urllib.error.HTTPError; 304 is returned as-is.
+        If sink is given, a 200 body is streamed into it in 64 KiB chunks and body is None.
+        """
+        for _ in range(_MAX_REDIRECTS + 1):
+            status, response_headers, body = self._get_once(url, headers, timeout, sink)
+            location = response_headers.get('Location')
+            if status in _REDIRECT_STATUSES and location:
+                url = urllib.parse.urljoin(url, location)
+                continue
+            if status not in (200, 304):
+                raise urllib.error.HTTPError(url, status, f"Unexpected HTTP status {status}",
+                                             response_headers, io.BytesIO(body or b''))
+            return status, response_headers, body
+        raise urllib.error.HTTPError(url, status, "Too many redirects", response_headers, io.BytesIO(body or b''))
+    
+    def _get_once(self, url, headers, timeout, sink):
+        parts = urllib.parse.urlsplit(url)
+        host = f"{parts.scheme}://{parts.netloc}"
+        path = parts.path + (f"?{parts.query}" if parts.query else "")
+        request_headers = {**self.headers, **(headers or {})}
+        
+        with self._host_lock(host):
+            while True:
+                entry = self._connections.get(host)
+                reused = entry is not None
+                if entry is None:
+                    entry = self._connect(parts, timeout)
+                    self._connections[host] = entry
+                conn, proxy_headers, absolute = entry
+                if reused and conn.sock:
+                    conn.sock.settimeout(timeout)
+                
+                streaming = False
+                try:
+                    conn.request('GET', url if absolute else path, headers={**request_headers, **proxy_headers})
+                    response = conn.getresponse()
+                    if sink is not None and response.status == 200:
+                        streaming = True
+                        shutil.copyfileobj(response, sink, 64 * 1024)
+                        if response.length:
+                            # Chunked reads stop quietly at EOF; a cut-off body must not pass as 200
+                            raise http.client.IncompleteRead(b'', response.length)
+                        body = None
+                    else:
+                        body = response.read()
+                except ConnectionError:
+                    self._drop(host)
+                    if reused and not streaming:
+                        # The server closed the idle keep-alive connection; retry once on a fresh one.
+                        # Never once part of the body is in sink: a retry would append a second copy.
+                        continue
+                    raise
+                except Exception:
+                    self._drop(host)
+                    raise
+                break
+            
+            if response.will_close:
+                self._drop(host)
+        
+        return response.status, response.headers, body
+    
+    def close(self):
+        """Close every connection without waiting for transfers in progress.
+        
+        A request still running on another thread sees its socket shut down and fails
+        instead of holding the caller (e.g. app shutdown on the Tk thread) until it ends.
+        """
+        with self._locks_guard:
+            entries = list(self._connections.values())
+            self._connections.clear()
+        for conn, _, _ in entries:
+            sock = conn.sock
+            if sock is not None:
+                try:
+                    sock.shutdown(socket.SHUT_RDWR)
+                except OSError:
+                    pass
+                sock.close()
 
-@dataclass
+@dataclass(slots=True)
 class Course:
     id: int
     name: str
@@ -97,10 +431,41 @@ class Course:
     term: Optional[str] = None
     start_at: Optional[str] = None
     end_at: Optional[str] = None
+    # end_at parsed once to a POSIX timestamp (None if missing or unparseable)
+    _end_ts: Optional[float] = field(init=False, default=None, repr=False, compare=False)
+    
+    def __post_init__(self):
+        if self.end_at:
+            try:
+                self._end_ts = datetime.fromisoformat(self.end_at.replace('Z', '+00:00')).timestamp()
+            except (ValueError, TypeError, AttributeError):
+                self._end_ts = None
+    
+    def as_dict(self) -> Dict[str, Any]:
+        """Plain dict form used for the API and the cache file"""
+        return dict(zip(_COURSE_FIELDS, _get_course_fields(self)))
+    
+    @classmethod
+    def from_dict(cls, d: Dict[str, Any]) -> 'Course':
+        """Inverse of as_dict, filling defaults for fields missing from older cache files"""
+        get = d.get
+        return cls(
+            id=get('id'),
+            name=get('name', 'Unknown Course'),
+            course_code=get('course_code', ''),
+            workflow_state=get('workflow_state', 'available'),
+            term=get('term'),
+            start_at=get('start_at'),
+            end_at=get('end_at')
+        )
+
+# Fetches every serialized Course attribute in a single C-level call
+_COURSE_FIELDS = ('id', 'name', 'course_code', 'workflow_state', 'term', 'start_at', 'end_at')
+_get_course_fields = operator.attrgetter(*_COURSE_FIELDS)
 
 class CanvasAPI:
 
-    def __init__(self, base_url: str, token: str):
+    def __init__(self, base_url: str, token: str, cache_dir: Optional[Path] = None):
         # Clean up the URL and determine the API base
         self.original_url = base_url.rstrip('/')
         self.api_base = self._determine_api_base(base_url)
@@ -109,6 +474,54 @@ class CanvasAPI:
             'Authorization': f'Bearer {token}',
             'Content-Type': 'application/json'
         }
+        
+        # Conditional GET cache (ETag / Last-Modified per URL), only when a cache dir is given
+        self.cache_dir = cache_dir
+        # Cached responses are per token, so another account's data is never replayed
+        self._token_digest = hashlib.sha256(token.encode('utf-8')).hexdigest()[:16]
+        self._etag_cache: Dict[str, Dict[str, str]] = self._load_http_cache()
+    
+    def _load_http_cache(self) -> Dict[str, Dict[str, str]]:
+        """Load stored validators for previous responses"""
+        if not self.cache_dir:
+            return {}
+        try:
+            cache = _json_loads((self.cache_dir / 'http_cache.json').read_bytes())
+        except (OSError, ValueError):
+            return {}
+        return cache if isinstance(cache, dict) else {}
+    
+    def _cache_key(self, url: str) -> str:
+        return f"{self._token_digest} {url}"
+    
+    def _cache_body_path(self, url: str) -> Path:
+        key = self._cache_key(url)
+        return self.cache_dir / f"cache_{hashlib.sha1(key.encode('utf-8')).hexdigest()[:16]}.json"
+    
+    def _store_cached_response(self, url: str, response, body: bytes):
+        """Persist the response body and its validators for the next conditional GET"""
+        etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified')
+        if not self.cache_dir or not (etag or last_modified):
+            return
+        try:
+            _write_file_atomic(self._cache_body_path(url), body)
+            entry = {'etag': etag or '', 'last_modified': last_modified or ''}
+            # Several CanvasAPI instances can share cache_dir (app, GUI test, web save):
+            # merge into what is on disk so one instance doesn't drop another's entries.
+            # The disk copy wins for other URLs, since its validators match the body files
+            with _HTTP_CACHE_LOCK:
+                self._etag_cache = {**self._etag_cache, **self._load_http_cache(),
+                                    self._cache_key(url): entry}
+                _write_file_atomic(self.cache_dir / 'http_cache.json', _json_dumps_bytes(self._etag_cache))
+        except OSError as e:
+            print(f"Failed to store HTTP cache entry: {e}")
+    
+    def _load_cached_response(self, url: str) -> Any:
+        try:
+            return _json_loads(self._cache_body_path(url).read_bytes())
+        except (OSError, ValueError):
+            return None
     
     def _determine_api_base(self, url: str) -> str:
         """Determine the correct API base URL"""
@@ -126,18 +539,37 @@ class CanvasAPI:
         """Return the original URL for display purposes"""
         return self.original_url
     
-    def make_request(self, endpoint: str) -> Any:
+    def make_request(self, endpoint: str, use_cache: bool = True) -> Any:
         
         url = f"{self.api_base}/{endpoint}"
         
         try:
-            print(f"Making Canvas API request to: {url}")
-            request = urllib.request.Request(url, headers=self.headers)
+            log.debug("Making Canvas API request to: %s", url)
+            headers = dict(self.headers)
+            validators = self._etag_cache.get(self._cache_key(url)) if use_cache else None
+            if validators:
+                if validators.get('etag'):
+                    headers['If-None-Match'] = validators['etag']
+                if validators.get('last_modified'):
+                    headers['If-Modified-Since'] = validators['last_modified']
+            
+            request = urllib.request.Request(url, headers=headers)
             with urllib.request.urlopen(request, timeout=30) as response:
-                data = json.loads(response.read().decode())
-                print(f"API request successful, received {len(data) if isinstance(data, list) else 'data'}")
+                body = response.read()
+                data = json.loads(body.decode())
+                self._store_cached_response(url, response, body)
+                log.debug("API request successful, received %s", len(data) if isinstance(data, list) else 'data')
                 return data
         except urllib.error.HTTPError as e:
+            if e.code == 304 and validators:
+                data = self._load_cached_response(url)
+                if data is not None:
+                    log.debug("API response not modified, using cached data")
+                    return data
+                # Cached body is gone, fetch the full response again
+                self._etag_cache.pop(self._cache_key(url), None)
+                return self.make_request(endpoint, use_cache=False)
+            
             error_msg = f"HTTP {e.code} error: {e.reason}"
             if e.code == 401:
                 error_msg += " - Check your access token"
@@ -188,40 +620,47 @@ class CanvasAPI:
         name = course_data.get('name', '')
         course_code = course_data.get('course_code', '')
 
-        term_pattern = r'(Fall|Spring|Summer|Winter)\s*(\d{4})'
-
-        match = re.search(term_pattern, name, re.IGNORECASE)
+        match = _TERM_RE.search(name)
         if match:
             return f"{match.group(1)} {match.group(2)}"
 
-        match = re.search(term_pattern, course_code, re.IGNORECASE)
+        match = _TERM_RE.search(course_code)
         if match:
             return f"{match.group(1)} {match.group(2)}"
 
-        year_pattern = r'(\d{4})'
-        match = re.search(year_pattern, name)
+        match = _YEAR_RE.search(name)
         if match:
             return match.group(1)
         
-        match = re.search(year_pattern, course_code)
+        match = _YEAR_RE.search(course_code)
         if match:
             return match.group(1)
 
-        term_id_pattern = r'Term:\s*(\d+)'
-        if 'Term:' in name:
-            match = re.search(term_id_pattern, name)
-            if match:
-                return f"Term: {match.group(1)}"
+        match = _TERM_ID_RE.search(name)
+        if match:
+            return f"Term: {match.group(1)}"
         
         return "Current Term"
 
+class DashboardHTTPServer(http.server.ThreadingHTTPServer):
+    daemon_threads = True
+    # On Windows SO_REUSEADDR lets a bind succeed on a port another process is
+    # listening on, so only ask for it where it means "skip TIME_WAIT"
+    allow_reuse_address = os.name != 'nt'
+
 class CanvasNotesServer(http.server.SimpleHTTPRequestHandler):
     def __init__(self, *args, app_instance=None, **kwargs):
         self.app_instance = app_instance
         super().__init__(*args, **kwargs)
     
+    def log_message(self, format, *args):
+        # Route the per-request access log through the dev logger instead of stderr;
+        # skip the formatting entirely when debug logging is off
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("%s - " + format, self.address_string(), *args)
+    
     def do_GET(self):
-        print(f"GET request for: {self.path}")
+        log.debug("GET request for: %s", self.path)
         
         if self.path == '/':
             # Serve index.html from src directory
@@ -246,32 +685,43 @@ class CanvasNotesServer(http.server.SimpleHTTPRequestHandler):
         try:
             if self.app_instance and hasattr(self.app_instance, 'src_dir'):
                 file_path = self.app_instance.src_dir / filename
-                print(f"Trying to serve: {file_path}")
+                log.debug("Trying to serve: %s", file_path)
                 
-                if file_path.exists() and file_path.is_file():
-                    # Determine content type
-                    content_type = 'text/html'
-                    if filename.endswith('.css'):
-                        content_type = 'text/css'
-                    elif filename.endswith('.js'):
-                        content_type = 'application/javascript'
-                    elif filename.endswith('.json'):
-                        content_type = 'application/json'
+                try:
+                    st = file_path.stat()
+                except OSError:
+                    st = None
+                
+                if st and stat.S_ISREG(st.st_mode):
+                    content_type = _CONTENT_TYPES.get(file_path.suffix.lower(), 'application/octet-stream')
+                    
+                    # Let the browser revalidate cheaply against the file's mtime
+                    etag = f'"{st.st_mtime_ns:x}"'
+                    if self.headers.get('If-None-Match') == etag:
+                        self.send_response(304)
+                        self.send_header('ETag', etag)
+                        self.send_header('Cache-Control', 'no-cache')
+                        self.end_headers()
+                        log.debug("Not modified: %s", filename)
+                        return
                     
-                    # Read and serve the file
-                    with open(file_path, 'rb') as f:
-                        content = f.read()
+                    if st.st_size >= _SENDFILE_MIN_SIZE:
+                        # Large assets go file -> socket in the kernel where the OS supports it
+                        with open(file_path, 'rb') as f:
+                            self._send_file_headers(content_type, os.fstat(f.fileno()).st_size, etag)
+                            self.wfile.flush()
+                            self.connection.sendfile(f)
+                        log.debug("Successfully sent: %s", filename)
+                        return
                     
-                    self.send_response(200)
-                    self.send_header('Content-type', content_type)
-                    self.send_header('Content-Length', len(content))
-                    self.send_header('Cache-Control', 'no-cache')
-                    self.end_headers()
+                    content = self.app_instance.read_src_file(file_path, st.st_mtime_ns)
+                    
+                    self._send_file_headers(content_type, len(content), etag)
                     self.wfile.write(content)
-                    print(f"Successfully served: {filename}")
+                    log.debug("Successfully served: %s", filename)
                     return
                 else:
-                    print(f"File not found: {file_path}")
+                    log.debug("File not found: %s", file_path)
             
             # File not found
             self.send_error(404, f"File not found: {filename}")
@@ -280,6 +730,14 @@ class CanvasNotesServer(http.server.SimpleHTTPRequestHandler):
             print(f"Error serving file {filename}: {e}")
             self.send_error(500, f"Server error: {str(e)}")
 
+    def _send_file_headers(self, content_type, length, etag):
+        self.send_response(200)
+        self.send_header('Content-type', content_type)
+        self.send_header('Content-Length', length)
+        self.send_header('Cache-Control', 'no-cache')
+        self.send_header('ETag', etag)
+        self.end_headers()
+
     def do_POST(self):
         if self.path.startswith('/api/'):
             self.handle_api_request()
@@ -314,52 +772,42 @@ class CanvasNotesServer(http.server.SimpleHTTPRequestHandler):
     def handle_courses_request(self):
         if self.command == 'GET':
             courses_data = []
-            if self.app_instance and self.app_instance.courses:
-                for course in self.app_instance.courses:
-                    courses_data.append({
-                        'id': course.id,
-                        'name': course.name,
-                        'course_code': course.course_code,
-                        'workflow_state': course.workflow_state,
-                        'term': course.term,
-                        'start_at': course.start_at,
-                        'end_at': course.end_at
-                    })
+            if self.app_instance:
+                # Snapshot under the lock, serialize after releasing it
+                courses_data = list(map(Course.as_dict, self.app_instance.get_courses_snapshot()))
             
             self.send_json_response(courses_data)
         
         elif self.command == 'POST':
-            content_length = int(self.headers['Content-Length'])
-            post_data = self.rfile.read(content_length)
-            data = json.loads(post_data.decode('utf-8'))
+            data = self._read_json()
             
             if self.app_instance:
-                self.app_instance.refresh_courses_from_api()
+                # Concurrent refresh requests share the single in-flight Canvas fetch
+                self.app_instance.refresh_courses_shared().result(timeout=60)
                 self.send_json_response({'success': True})
     
     def handle_config_request(self):
         if self.command == 'GET':
             config = {}
-            print(f"Config request - app_instance exists: {self.app_instance is not None}")
+            log.debug("Config request - app_instance exists: %s", self.app_instance is not None)
             if self.app_instance and hasattr(self.app_instance, 'canvas_api'):
-                print(f"canvas_api exists: {self.app_instance.canvas_api is not None}")
+                log.debug("canvas_api exists: %s", self.app_instance.canvas_api is not None)
                 if self.app_instance.canvas_api:
                     config = {
                         'canvas_url': self.app_instance.canvas_api.base_url,
                         'canvas_token': self.app_instance.canvas_api.token,
                         'has_token': bool(self.app_instance.canvas_api.token)
                     }
-                    print(f"Sending config: {{'canvas_url': '{config['canvas_url']}', 'token_length': {len(config['canvas_token'])}, 'has_token': {config['has_token']}}}")
+                    log.debug("Sending config: {'canvas_url': '%s', 'token_length': %d, 'has_token': %s}",
+                              config['canvas_url'], len(config['canvas_token']), config['has_token'])
                 else:
-                    print("canvas_api is None")
+                    log.debug("canvas_api is None")
             else:
-                print("app_instance or canvas_api attribute missing")
+                log.debug("app_instance or canvas_api attribute missing")
             self.send_json_response(config)
         
         elif self.command == 'POST':
-            content_length = int(self.headers['Content-Length'])
-            post_data = self.rfile.read(content_length)
-            data = json.loads(post_data.decode('utf-8'))
+            data = self._read_json()
             
             if self.app_instance:
                 success = self.app_instance.save_api_config_from_web(data)
@@ -369,9 +817,7 @@ class CanvasNotesServer(http.server.SimpleHTTPRequestHandler):
         """Handle API connection testing"""
         if self.command == 'POST':
             try:
-                content_length = int(self.headers['Content-Length'])
-                post_data = self.rfile.read(content_length)
-                data = json.loads(post_data.decode('utf-8'))
+                data = self._read_json()
                 
                 url = data.get('canvas_url', '').strip()
                 token = data.get('canvas_token', '').strip()
@@ -389,7 +835,12 @@ class CanvasNotesServer(http.server.SimpleHTTPRequestHandler):
                 test_api = CanvasAPI(url, token)
                 print(f"API will connect to: {test_api.api_base}")
                 
-                test_courses = test_api.get_courses()  # This will raise an exception if it fails
+                # This will raise an exception if it fails
+                if self.app_instance:
+                    # Same single Canvas worker as refreshes, so web requests never fetch in parallel
+                    test_courses = self.app_instance._canvas_worker.submit(test_api.get_courses).result(timeout=60)
+                else:
+                    test_courses = test_api.get_courses()
                 
                 self.send_json_response({
                     'success': True, 
@@ -423,9 +874,7 @@ class CanvasNotesServer(http.server.SimpleHTTPRequestHandler):
         """Handle saving API configuration"""
         if self.command == 'POST':
             try:
-                content_length = int(self.headers['Content-Length'])
-                post_data = self.rfile.read(content_length)
-                data = json.loads(post_data.decode('utf-8'))
+                data = self._read_json()
                 
                 if self.app_instance:
                     success = self.app_instance.save_api_config_from_web(data)
@@ -489,7 +938,6 @@ class CanvasNotesServer(http.server.SimpleHTTPRequestHandler):
                         latest_version = update_info.get('latest_version', 'unknown')
                         
                         # Start update process in a separate thread
-                        import threading
                         update_thread = threading.Thread(
                             target=self.app_instance.start_update_process, 
                             args=(latest_version,), 
@@ -510,19 +958,11 @@ class CanvasNotesServer(http.server.SimpleHTTPRequestHandler):
             # Handle complete update (both app and src)
             if self.app_instance:
                 try:
-                    content_length = int(self.headers.get('Content-Length', 0))
-                    if content_length > 0:
-                        post_data = self.rfile.read(content_length)
-                        data = json.loads(post_data.decode('utf-8'))
-                        update_app = data.get('update_app', True)
-                        update_src = data.get('update_src', True)
-                    else:
-                        update_app = True
-                        update_src = True
+                    data = self._read_json()
+                    update_app = data.get('update_app', True)
+                    update_src = data.get('update_src', True)
                     
                     # Perform the update in a separate thread
-                    import threading
-                    
                     def update_thread():
                         results = self.app_instance.perform_complete_update(update_app, update_src)
                         print(f"Update results: {results}")
@@ -552,16 +992,21 @@ class CanvasNotesServer(http.server.SimpleHTTPRequestHandler):
                 self.send_json_response(files)
             
             elif self.command == 'POST':
-                content_length = int(self.headers['Content-Length'])
-                post_data = self.rfile.read(content_length)
-                data = json.loads(post_data.decode('utf-8'))
+                data = self._read_json()
                 
                 success = self.app_instance.save_course_file(
                     course_name, data.get('filename'), data.get('content'))
                 self.send_json_response({'success': success})
     
+    def _read_json(self):
+        """Read and parse the JSON request body; an empty body parses as {}"""
+        content_length = int(self.headers.get('Content-Length', 0) or 0)
+        if not content_length:
+            return {}
+        return _json_loads(self.rfile.read(content_length))
+    
     def send_json_response(self, data):
-        json_data = json.dumps(data).encode('utf-8')
+        json_data = _json_dumps_bytes(data)
         self.send_response(200)
         self.send_header('Content-type', 'application/json')
         self.send_header('Content-Length', len(json_data))
@@ -570,17 +1015,44 @@ class CanvasNotesServer(http.server.SimpleHTTPRequestHandler):
         self.wfile.write(json_data)
 
 class SimpleDashboardApp:
+    
+    # Shared Tk widget styles, built once and splatted into each widget
+    _ENTRY_STYLE = dict(font=("Segoe UI", 9), bg="#1e2530", fg="#ffffff", insertbackground="#ffffff")
+    _FIELD_LABEL_STYLE = dict(font=("Segoe UI", 9), fg="#ffffff", bg="#0f1419")
+    _CONFIG_BTN_STYLE = dict(fg="white", font=("Segoe UI", 9, "bold"), padx=15, pady=5, cursor="hand2")
+    _BTN_BASE = dict(fg="white", font=("Segoe UI", 10, "bold"), padx=20, pady=8, cursor="hand2")
 
     def __init__(self):
         self.canvas_api = None
         self.courses = []
-        self.hidden_courses = set()
+        self._courses_lock = threading.RLock()
+        # Long-lived worker that performs web-triggered Canvas fetches
+        self._canvas_worker = ThreadPoolExecutor(max_workers=1, thread_name_prefix="canvas-io")
+        self._refresh_future: Optional[Future] = None
+        # Shared keep-alive connections for GitHub update checks and downloads
+        self._http = KeepAliveHTTPClient({'User-Agent': 'CanvasNotes/1.0'})
+        # Background pool for network work started from the Tk window
+        self._io_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="gui-io")
+        # Read-mostly; replaced wholesale via set_hidden_courses so saves can skip unchanged data
+        self.hidden_courses = frozenset()
+        self._hidden_dirty = False
+        self._hidden_save_timer: Optional[threading.Timer] = None
         self.showing_past = False
         self.server_port = 8080
         self.server_thread = None
         self.httpd = None
+        
+        # In-memory copies of served src files, keyed by path: (mtime_ns, content)
+        self._src_cache: Dict[str, tuple] = {}
+        self._src_lock = threading.Lock()
+        # Decoded course notes keyed by path, reused while (mtime_ns, size) is unchanged
+        self._notes_cache: "OrderedDict[str, tuple]" = OrderedDict()
+        self._notes_cache_chars = 0
+        self._notes_lock = threading.Lock()
+        # Parallel cold reads for get_course_files (called from web server threads)
+        self._notes_pool = ThreadPoolExecutor(max_workers=min(8, (os.cpu_count() or 1) * 2),
+                                              thread_name_prefix="notes-io")
 
-        import os
         documents_path = Path.home() / "Documents"
         self.data_dir = documents_path / "CanvasData"
         self.data_dir.mkdir(exist_ok=True)
@@ -588,6 +1060,14 @@ class SimpleDashboardApp:
         self.data_file = self.data_dir / "canvas_courses.json"
         self.config_file = self.data_dir / "canvas_config.json"
         
+        # Parsed config, read once and written back only when it changes
+        self._config_cache: Optional[Dict[str, Any]] = None
+        self._config_mtime_ns: Optional[int] = None
+        self._config_dirty = False
+        self._config_lock = threading.RLock()
+        self._last_config_flush = 0.0
+        self._config_flush_timer: Optional[threading.Timer] = None
+        
         # Set src directory based on dev mode
         if DEV_MODE:
             # Use local src folder for development
@@ -644,25 +1124,26 @@ class SimpleDashboardApp:
         self.root = tk.Tk()
         self.setup_window()
         self.root.protocol("WM_DELETE_WINDOW", self.on_closing)
-        self.root.after(1000, self.check_for_updates_startup)
+        self.root.after_idle(self.check_for_updates_startup)
         self.root.after(2000, self.open_web_interface_external)
     
-    def calculate_time_remaining(self, course: Course) -> str:
+    def calculate_time_remaining(self, course: Course, now_ts: Optional[float] = None) -> str:
+        """Describe the time left in a course; pass now_ts when rendering many courses at once"""
         if not course.end_at:
             return "No end date"
         
         try:
-            from datetime import datetime, timezone
-            
-            end_date = datetime.fromisoformat(course.end_at.replace('Z', '+00:00'))
-            current_date = datetime.now(timezone.utc)
+            if course._end_ts is None:
+                return "Date error"
+            if now_ts is None:
+                now_ts = datetime.now(timezone.utc).timestamp()
             
-            time_diff = end_date - current_date
+            seconds_left = course._end_ts - now_ts
             
-            if time_diff.total_seconds() <= 0:
+            if seconds_left <= 0:
                 return "Ended"
             
-            days = time_diff.days
+            days = int(seconds_left // 86400)
             
             if days > 365:
                 years = days // 365
@@ -673,7 +1154,7 @@ class SimpleDashboardApp:
             elif days > 0:
                 return f"{days} days left"
             else:
-                hours = int(time_diff.total_seconds() // 3600)
+                hours = int(seconds_left // 3600)
                 if hours > 0:
                     return f"{hours}h left"
                 else:
@@ -716,24 +1197,18 @@ class SimpleDashboardApp:
         url_frame = tk.Frame(config_frame, bg="#0f1419")
         url_frame.pack(pady=5, fill=tk.X, padx=10)
         
-        tk.Label(url_frame, text="Canvas URL:", 
-                font=("Segoe UI", 9),
-                fg="#ffffff", bg="#0f1419").pack(anchor=tk.W)
+        tk.Label(url_frame, text="Canvas URL:", **self._FIELD_LABEL_STYLE).pack(anchor=tk.W)
         
-        self.url_entry = tk.Entry(url_frame, font=("Segoe UI", 9),
-                                 bg="#1e2530", fg="#ffffff", insertbackground="#ffffff")
+        self.url_entry = tk.Entry(url_frame, **self._ENTRY_STYLE)
         self.url_entry.pack(fill=tk.X, pady=(2, 0))
         
         # Token Entry
         token_frame = tk.Frame(config_frame, bg="#0f1419")
         token_frame.pack(pady=5, fill=tk.X, padx=10)
         
-        tk.Label(token_frame, text="Access Token:", 
-                font=("Segoe UI", 9),
-                fg="#ffffff", bg="#0f1419").pack(anchor=tk.W)
+        tk.Label(token_frame, text="Access Token:", **self._FIELD_LABEL_STYLE).pack(anchor=tk.W)
         
-        self.token_entry = tk.Entry(token_frame, font=("Segoe UI", 9), show="*",
-                                   bg="#1e2530", fg="#ffffff", insertbackground="#ffffff")
+        self.token_entry = tk.Entry(token_frame, show="*", **self._ENTRY_STYLE)
         self.token_entry.pack(fill=tk.X, pady=(2, 0))
         
         # Config buttons
@@ -742,16 +1217,12 @@ class SimpleDashboardApp:
         
         self.save_config_btn = tk.Button(config_btn_frame, text="Save Config", 
                                         command=self.save_api_config_gui,
-                                        bg="#28a745", fg="white",
-                                        font=("Segoe UI", 9, "bold"),
-                                        padx=15, pady=5, cursor="hand2")
+                                        bg="#28a745", **self._CONFIG_BTN_STYLE)
         self.save_config_btn.pack(side=tk.LEFT, padx=(0, 5))
         
         self.test_config_btn = tk.Button(config_btn_frame, text="Test Connection", 
                                         command=self.test_api_connection,
-                                        bg="#17a2b8", fg="white",
-                                        font=("Segoe UI", 9, "bold"),
-                                        padx=15, pady=5, cursor="hand2")
+                                        bg="#17a2b8", **self._CONFIG_BTN_STYLE)
         self.test_config_btn.pack(side=tk.LEFT, padx=5)
         
         # Load existing config into fields
@@ -794,16 +1265,12 @@ class SimpleDashboardApp:
         
         self.open_btn = tk.Button(button_frame, text="Open in Browser", 
                                  command=self.open_web_interface,
-                                 bg="#4a9eff", fg="white",
-                                 font=("Segoe UI", 10, "bold"),
-                                 padx=20, pady=8, cursor="hand2")
+                                 bg="#4a9eff", **self._BTN_BASE)
         self.open_btn.pack(side=tk.LEFT, padx=(0, 10))
         
         self.quit_btn = tk.Button(button_frame, text="Quit", 
                                  command=self.on_closing,
-                                 bg="#dc3545", fg="white",
-                                 font=("Segoe UI", 10, "bold"),
-                                 padx=20, pady=8, cursor="hand2")
+                                 bg="#dc3545", **self._BTN_BASE)
         self.quit_btn.pack(side=tk.LEFT)
         
         self.root.configure(bg="#0f1419")
@@ -826,8 +1293,12 @@ class SimpleDashboardApp:
             messagebox.showerror("Error", "Please enter both Canvas URL and Access Token")
             return
         
-        # Test the configuration first
-        if self.test_api_connection(silent=True):
+        # Test the configuration first; the fields were already read and validated above
+        self._run_in_background(self._apply_config, (url, token),
+                                lambda future: self._on_test_api_done(future, True, self._on_save_config_tested))
+    
+    def _on_save_config_tested(self, success):
+        if success:
             messagebox.showinfo("Success", "API configuration saved and tested successfully!")
         else:
             result = messagebox.askyesno("Warning", 
@@ -835,80 +1306,84 @@ class SimpleDashboardApp:
             if not result:
                 return
     
-    def test_api_connection(self, silent=False):
-        """Test API connection"""
+    def _run_in_background(self, func, args, on_done):
+        """Run blocking I/O off the Tk thread and hand the finished future back to it"""
+        future = self._io_pool.submit(func, *args)
+        future.add_done_callback(lambda f: self.root.after(0, on_done, f))
+    
+    def test_api_connection(self, silent=False, on_result=None):
+        """Test API connection in the background; on_result receives True/False"""
         url = self.url_entry.get().strip()
         token = self.token_entry.get().strip()
         
         if not url or not token:
             if not silent:
                 messagebox.showerror("Error", "Please enter both Canvas URL and Access Token")
-            return False
+            if on_result:
+                on_result(False)
+            return
         
+        self._run_in_background(self._apply_config, (url, token),
+                                lambda future: self._on_test_api_done(future, silent, on_result))
+    
+    def _apply_config(self, url, token):
+        """Test url/token against Canvas and, if they work, adopt and save them.
+        
+        Blocking; returns the number of courses found and raises if the connection fails.
+        """
+        test_api = CanvasAPI(url, token, cache_dir=self.data_dir)
+        courses = test_api.get_courses()
+        
+        # If successful, save the configuration (one config write)
+        self.canvas_api = test_api
+        self._update_config({
+            'canvas_url': url,
+            'canvas_token': token,
+            'last_updated': datetime.now().isoformat()
+        })
+        
+        # The test already fetched the course list, so use it instead of fetching again
+        with self._courses_lock:
+            self.courses = courses
+        self.save_courses_to_cache(courses)
+        
+        return len(courses)
+    
+    def _on_test_api_done(self, future, silent, on_result):
         try:
-            # Test the API connection
-            test_api = CanvasAPI(url, token)
-            test_courses = test_api.get_courses()
-            
-            # If successful, save the configuration
-            self.canvas_api = test_api
-            
-            # Save to config file
-            config_data = {}
-            if self.config_file.exists():
-                with open(self.config_file, 'r') as f:
-                    config_data = json.load(f)
-            
-            config_data.update({
-                'canvas_url': url,
-                'canvas_token': token,
-                'last_updated': datetime.now().isoformat()
-            })
-            
-            with open(self.config_file, 'w') as f:
-                json.dump(config_data, f, indent=2)
-            
-            # Refresh courses
-            self.refresh_courses_from_api()
+            course_count = future.result()
             
             if not silent:
                 messagebox.showinfo("Success", 
-                    f"Connection successful! Found {len(test_courses)} courses.")
-            
-            return True
+                    f"Connection successful! Found {course_count} courses.")
+            success = True
             
         except Exception as e:
             if not silent:
                 messagebox.showerror("Connection Failed", 
                     f"Failed to connect to Canvas API:\n{str(e)}")
-            return False
+            success = False
+        
+        if on_result:
+            on_result(success)
     
     def check_updates_manual(self):
         """Manually check for updates"""
+        self._run_in_background(self.check_all_updates, (), self._on_updates_checked)
+    
+    def _on_updates_checked(self, future):
         try:
-            update_info = self.check_all_updates()
+            update_info = future.result()
             
-            app_info = update_info.get('app', {})
-            src_info = update_info.get('src', {})
+            app_info = update_info.get('app') or _NO_INFO
+            src_info = update_info.get('src') or _NO_INFO
             
-            message_parts = []
-            
-            # App update info
-            if app_info.get('has_update', False):
-                latest = app_info.get('latest_version', 'unknown')
-                current = app_info.get('current_version', 'unknown')
-                message_parts.append(f"App Update Available: {current} → {latest}")
-            else:
-                message_parts.append("App: Up to date")
-            
-            # Src update info
-            if not DEV_MODE:
-                if src_info.get('needs_update', False):
-                    message_parts.append("Interface Files: Update available")
-                else:
-                    message_parts.append("Interface Files: Up to date")
-            else:
-                message_parts.append("Interface Files: Dev mode (local files)")
+            message_parts = [
+                _APP_MSG[bool(app_info.get('has_update'))].format(
+                    current=app_info.get('current_version', 'unknown'),
+                    latest=app_info.get('latest_version', 'unknown')),
+                _SRC_DEV_MSG if DEV_MODE else _SRC_MSG[bool(src_info.get('needs_update'))],
+            ]
             
             message = "\n".join(message_parts)
             
@@ -916,21 +1391,37 @@ class SimpleDashboardApp:
                 result = messagebox.askyesno("Updates Available", 
                     f"{message}\n\nWould you like to update now?")
                 if result:
-                    self.perform_complete_update()
+                    self._run_in_background(self.perform_complete_update, (), self._on_complete_update_done)
             else:
                 messagebox.showinfo("No Updates", message)
                 
         except Exception as e:
             messagebox.showerror("Error", f"Failed to check for updates:\n{str(e)}")
     
+    def _on_complete_update_done(self, future):
+        # A started app update closes the window itself (or reports its own failure)
+        try:
+            results = future.result()
+        except Exception as e:
+            results = {'app_updated': False, 'src_updated': False, 'errors': [str(e)]}
+        if results['app_updated']:
+            return
+        if results['src_updated']:
+            messagebox.showinfo("Update Complete", "Web interface files updated successfully!")
+        elif results['errors']:
+            messagebox.showerror("Update Failed", "\n".join(results['errors']))
+    
     def update_src_manual(self):
         """Manually update src files"""
         if DEV_MODE:
             messagebox.showinfo("Dev Mode", "src file updates are disabled in development mode")
             return
         
+        self._run_in_background(self.update_src_folder, (), self._on_src_updated)
+    
+    def _on_src_updated(self, future):
         try:
-            success = self.update_src_folder()
+            success = future.result()
             if success:
                 messagebox.showinfo("Success", "Interface files updated successfully!")
             else:
@@ -944,8 +1435,12 @@ class SimpleDashboardApp:
             messagebox.showerror("Error", "Please configure Canvas API first")
             return
         
+        future = self.refresh_courses_shared()
+        future.add_done_callback(lambda f: self.root.after(0, self._on_courses_refreshed, f))
+    
+    def _on_courses_refreshed(self, future):
         try:
-            success = self.refresh_courses_from_api()
+            success = future.result()
             if success:
                 course_count = len(self.courses)
                 messagebox.showinfo("Success", f"Courses refreshed! Found {course_count} courses.")
@@ -960,6 +1455,7 @@ class SimpleDashboardApp:
             if os.name == 'nt':  # Windows
                 os.startfile(str(self.data_dir))
             elif os.name == 'posix':  # macOS and Linux
+                import subprocess
                 subprocess.call(['open' if sys.platform == 'darwin' else 'xdg-open', str(self.data_dir)])
         except Exception as e:
             messagebox.showerror("Error", f"Failed to open data folder:\n{str(e)}")
@@ -970,25 +1466,40 @@ class SimpleDashboardApp:
             "This will clear cached course data. Are you sure?")
         if result:
             try:
-                if self.data_file.exists():
-                    self.data_file.unlink()
-                self.courses = []
+                self.data_file.unlink(missing_ok=True)
+                with self._courses_lock:
+                    self.courses = []
                 messagebox.showinfo("Success", "Cache cleared successfully!")
             except Exception as e:
                 messagebox.showerror("Error", f"Failed to clear cache:\n{str(e)}")
     
     def start_web_server(self):
         try:
-            # Find available port
-            self.server_port = self.find_free_port()
-            
             # DON'T change working directory - serve files directly from src_dir
-            print(f"Starting server on port {self.server_port}")
             print(f"Will serve src files from: {self.src_dir}")
             
-            # Create server with custom handler
+            # Create server with custom handler; each request gets its own (daemon) thread
             handler = lambda *args, **kwargs: CanvasNotesServer(*args, app_instance=self, **kwargs)
-            self.httpd = socketserver.TCPServer(("", self.server_port), handler)
+            
+            # Reuse the last port so the URL stays stable; otherwise let the OS pick one
+            try:
+                last_port = self._load_config().get('last_port')
+            except (OSError, ValueError) as e:
+                print(f"Could not read last port from config: {e}")
+                last_port = None
+            self.httpd = None
+            if last_port:
+                try:
+                    self.httpd = DashboardHTTPServer(("", last_port), handler)
+                except OSError as e:
+                    print(f"Port {last_port} unavailable ({e}), picking a new one")
+            if self.httpd is None:
+                self.httpd = DashboardHTTPServer(("", 0), handler)
+            
+            self.server_port = self.httpd.server_address[1]
+            print(f"Starting server on port {self.server_port}")
+            if self.server_port != last_port:
+                self._update_config({'last_port': self.server_port})
             
             # Start server in background thread
             self.server_thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
@@ -1000,10 +1511,10 @@ class SimpleDashboardApp:
             print(f"Serving src from: {self.src_dir}")
             
             # Check if src files exist
-            if self.src_dir.exists():
-                src_files = list(self.src_dir.glob('*'))
-                print(f"Available src files: {[f.name for f in src_files]}")
-            else:
+            try:
+                with os.scandir(self.src_dir) as it:
+                    print(f"Available src files: {[entry.name for entry in it]}")
+            except FileNotFoundError:
                 print("WARNING: src directory does not exist!")
             
             # Only update GUI elements if they exist (tkinter mode)
@@ -1017,12 +1528,22 @@ class SimpleDashboardApp:
             if hasattr(self, 'status_label'):
                 self.status_label.config(text=f"Failed to start server: {e}")
     
-    def find_free_port(self):
-        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-            s.bind(('', 0))
-            s.listen(1)
-            port = s.getsockname()[1]
-        return port
+    def read_src_file(self, file_path, mtime_ns):
+        """Return the contents of a src file, served from memory while its mtime is unchanged"""
+        key = str(file_path)
+        with self._src_lock:
+            entry = self._src_cache.get(key)
+        if entry and entry[0] == mtime_ns:
+            return entry[1]
+        
+        content = file_path.read_bytes()
+        with self._src_lock:
+            self._src_cache[key] = (mtime_ns, content)
+        return content
+    
+    def clear_src_cache(self):
+        with self._src_lock:
+            self._src_cache.clear()
     
     def ensure_src_folder_exists(self):
         """Check if src folder exists in data directory, download from latest release if not"""
@@ -1032,7 +1553,8 @@ class SimpleDashboardApp:
             
         print(f"Checking src folder at: {self.src_dir}")
         
-        if self.src_dir.exists() and self.validate_src_folder(self.src_dir):
+        # validate_src_folder already treats a missing folder as invalid
+        if self.validate_src_folder(self.src_dir):
             print("src folder found and valid")
             return True
         
@@ -1050,20 +1572,30 @@ class SimpleDashboardApp:
         """Validate that src folder has required files"""
         required_files = ['index.html']  # Only HTML file needed now
         
+        # One directory scan gives names and (cached on Windows) sizes
+        try:
+            with os.scandir(src_dir) as it:
+                entries = {entry.name: entry for entry in it}
+        except FileNotFoundError:
+            entries = {}
+        except OSError as e:
+            print(f"Error reading src folder: {e}")
+            return False
+        
         for file_name in required_files:
-            file_path = src_dir / file_name
-            if not file_path.exists():
+            entry = entries.get(file_name)
+            if entry is None or not entry.is_file():
                 print(f"Missing required file: {file_name}")
                 return False
             
             # Check if HTML file has minimum content
             if file_name == 'index.html':
                 try:
-                    content = file_path.read_text(encoding='utf-8')
-                    if len(content) < 1000:  # Ensure it's not an empty or error page
-                        print(f"HTML file appears to be incomplete ({len(content)} bytes)")
+                    size = entry.stat().st_size
+                    if size < 1000:  # Ensure it's not an empty or error page
+                        print(f"HTML file appears to be incomplete ({size} bytes)")
                         return False
-                except Exception as e:
+                except OSError as e:
                     print(f"Error reading HTML file: {e}")
                     return False
         
@@ -1071,9 +1603,9 @@ class SimpleDashboardApp:
     
     def download_src_folder(self):
         """Download only the HTML file from GitHub repository"""
+        # Progress lines are collected and written in one go; errors are printed immediately
+        messages = ["Downloading HTML file from GitHub repository..."]
         try:
-            print("Downloading HTML file from GitHub repository...")
-            
             # GitHub raw content base URL
             base_url = "https://raw.githubusercontent.com/Giraffe801/CanvasNotes/main/src/"
             
@@ -1084,60 +1616,64 @@ class SimpleDashboardApp:
             
             # Create src directory in data folder
             self.src_dir.mkdir(exist_ok=True)
-            print(f"Created src directory: {self.src_dir}")
+            messages.append(f"Created src directory: {self.src_dir}")
             
             # Download the HTML file
             downloaded_files = 0
             for filename, url_path in src_files.items():
                 try:
                     file_url = base_url + url_path
-                    print(f"Downloading {filename} from {file_url}...")
+                    messages.append(f"Downloading {filename} from {file_url}...")
                     
-                    # Add headers to avoid GitHub rate limiting
-                    request = urllib.request.Request(file_url)
-                    request.add_header('User-Agent', 'CanvasNotes/1.0')
-                    
-                    with urllib.request.urlopen(request, timeout=30) as response:
-                        content = response.read()
-                        print(f"Downloaded {len(content)} bytes for {filename}")
-                    
-                    # Write file to src directory
+                    # Stream into a partial file so a failed download leaves the old copy intact
                     file_path = self.src_dir / filename
-                    with open(file_path, 'wb') as f:
-                        f.write(content)
+                    partial_path = file_path.with_name(filename + '.part')
+                    try:
+                        with open(partial_path, 'wb') as f:
+                            # Client sends a User-Agent to avoid GitHub rate limiting
+                            status, _, _ = self._http.get(file_url, timeout=30, sink=f)
+                        if status != 200:
+                            raise IOError(f"Unexpected HTTP status {status}")
+                        os.replace(partial_path, file_path)
+                    finally:
+                        partial_path.unlink(missing_ok=True)
                     
                     # Verify the file was written
-                    if file_path.exists():
-                        file_size = file_path.stat().st_size
-                        print(f"✓ Saved {filename} ({file_size} bytes)")
-                        downloaded_files += 1
-                    else:
-                        print(f"✗ Failed to save {filename}")
+                    file_size = file_path.stat().st_size
+                    messages.append(f"✓ Saved {filename} ({file_size} bytes)")
+                    downloaded_files += 1
                     
                 except Exception as e:
+                    self._flush_messages(messages)
                     print(f"✗ Failed to download {filename}: {e}")
             
-            print(f"Download complete: {downloaded_files}/{len(src_files)} files")
+            messages.append(f"Download complete: {downloaded_files}/{len(src_files)} files")
             
             if downloaded_files >= 1:  # At least the HTML file downloaded
-                print(f"Successfully downloaded {downloaded_files}/{len(src_files)} files")
-                
                 # List what we actually have
-                print("Files in src directory:")
-                for file_path in self.src_dir.glob('*'):
-                    print(f"  - {file_path.name} ({file_path.stat().st_size} bytes)")
+                messages.append("Files in src directory:")
+                with os.scandir(self.src_dir) as it:
+                    for entry in it:
+                        messages.append(f"  - {entry.name} ({entry.stat().st_size} bytes)")
+                self._flush_messages(messages)
                 
                 # Validate downloaded files
                 if self.validate_src_folder(self.src_dir):
+                    # Remember what we downloaded so later checks can spot a replaced/altered file;
+                    # only a validated file may become the "up to date" reference
+                    html_bytes = (self.src_dir / 'index.html').read_bytes()
+                    self._update_config({'src_html_sha256': hashlib.sha256(html_bytes).hexdigest()})
                     print("src folder downloaded and validated successfully!")
                     return True
                 else:
                     print("src folder validation failed")
             
-            print(f"Insufficient files downloaded: {downloaded_files}/{len(src_files)}")
+            messages.append(f"Insufficient files downloaded: {downloaded_files}/{len(src_files)}")
+            self._flush_messages(messages)
             return False
                 
         except Exception as e:
+            self._flush_messages(messages)
             print(f"Failed to download src folder from GitHub: {e}")
             print("Creating minimal fallback src folder...")
             
@@ -1145,71 +1681,40 @@ class SimpleDashboardApp:
             self.create_minimal_src_folder()
             return False
     
+    @staticmethod
+    def _flush_messages(messages):
+        """Write queued progress lines to stdout in a single call and empty the list"""
+        # sys.stdout is None in a windowed (no console) build, where print() is a no-op
+        if messages and sys.stdout is not None:
+            sys.stdout.write("\n".join(messages) + "\n")
+            sys.stdout.flush()
+        messages.clear()
+    
     def create_minimal_src_folder(self):
         """Create minimal src folder with basic HTML file if download fails"""
         print("Creating minimal src folder as fallback...")
         
         self.src_dir.mkdir(exist_ok=True)
         
-        # Create minimal HTML with embedded CSS (no external dependencies)
-        html_content = """<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Canvas Notes Dashboard</title>
-    <style>
-        body { 
-            font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif; 
-            margin: 0; 
-            padding: 0; 
-            background: linear-gradient(135deg, #0f1419 0%, #1a2332 100%); 
-            color: white; 
-            min-height: 100vh;
-            display: flex;
-            align-items: center;
-            justify-content: center;
-        }
-        .container {
-            text-align: center;
-            padding: 50px;
-            background: rgba(30, 40, 50, 0.8);
-            border-radius: 12px;
-            box-shadow: 0 8px 32px rgba(0, 0, 0, 0.3);
-        }
-        h1 {
-            color: #4a9eff;
-            margin-bottom: 20px;
-            font-size: 2.5rem;
-        }
-        p {
-            font-size: 1.2rem;
-            line-height: 1.6;
-            margin-bottom: 15px;
-        }
-        .status {
-            color: #ffc107;
-            font-weight: bold;
-        }
-    </style>
-</head>
-<body>
-    <div class="container">
-        <h1>🎓 Canvas Notes Dashboard</h1>
-        <p class="status">Minimal fallback mode</p>
-        <p>Please check your internet connection and try again.</p>
-        <p>The application will attempt to download the latest interface files when connectivity is restored.</p>
-    </div>
-</body>
-</html>"""
-        
-        # Write the minimal HTML file
-        (self.src_dir / "index.html").write_text(html_content, encoding='utf-8')
+        # Write the minimal HTML file (embedded CSS, no external dependencies)
+        (self.src_dir / "index.html").write_bytes(_FALLBACK_HTML_BYTES)
         
         print("Minimal src folder created successfully with standalone HTML file")
     
     def cleanup_server(self):
         """Clean up server resources"""
+        self._canvas_worker.shutdown(wait=False, cancel_futures=True)
+        self._io_pool.shutdown(wait=False, cancel_futures=True)
+        self._notes_pool.shutdown(wait=False, cancel_futures=True)
+        self._http.close()
+        
+        # Write out anything still waiting on a debounce timer
+        self.save_hidden_courses()
+        try:
+            self._flush_config()
+        except Exception as e:
+            print(f"Failed to save config: {e}")
+        
         try:
             if hasattr(self, 'httpd') and self.httpd:
                 self.httpd.shutdown()
@@ -1226,6 +1731,7 @@ class SimpleDashboardApp:
     def open_web_interface(self):
         """Open web interface in external browser (fallback only)"""
         if self.server_port and not HAS_WEBVIEW:
+            import webbrowser
             webbrowser.open(f"http://localhost:{self.server_port}")
     
     def open_web_interface_external(self):
@@ -1237,13 +1743,27 @@ class SimpleDashboardApp:
             return False
         
         try:
-            self.courses = self.canvas_api.get_courses()
-            self.save_courses_to_cache(self.courses)
+            courses = self.canvas_api.get_courses()
+            with self._courses_lock:
+                self.courses = courses
+            self.save_courses_to_cache(courses)
             return True
         except Exception as e:
             print(f"Failed to refresh courses: {e}")
             return False
     
+    def refresh_courses_shared(self) -> Future:
+        """Refresh courses on the Canvas worker, joining a refresh that is already running"""
+        with self._courses_lock:
+            if self._refresh_future is None or self._refresh_future.done():
+                self._refresh_future = self._canvas_worker.submit(self.refresh_courses_from_api)
+            return self._refresh_future
+    
+    def get_courses_snapshot(self) -> List[Course]:
+        """Return a copy of the current course list that is safe to iterate without the lock"""
+        with self._courses_lock:
+            return list(self.courses)
+    
     def save_api_config_from_web(self, data):
         url = data.get('canvas_url', '').strip()
         token = data.get('canvas_token', '').strip()
@@ -1252,35 +1772,39 @@ class SimpleDashboardApp:
             return False
         
         try:
-            test_api = CanvasAPI(url, token)
-            test_courses = test_api.get_courses()
-            
-            self.canvas_api = test_api
-            
-            config_data = {}
-            if self.config_file.exists():
-                with open(self.config_file, 'r') as f:
-                    config_data = json.load(f)
-            
-            config_data.update({
-                'canvas_url': url,
-                'canvas_token': token,
-                'last_updated': datetime.now().isoformat()
-            })
-            
-            with open(self.config_file, 'w') as f:
-                json.dump(config_data, f, indent=2)
-            
+            # Called from a web server thread; the Canvas fetch runs on the shared worker
+            self._canvas_worker.submit(self._apply_config, url, token).result(timeout=60)
             return True
         except Exception as e:
             print(f"Failed to save API config: {e}")
             return False
     
+    def _fetch_latest_version(self):
+        """Return the published app version, revalidating the cached answer with its ETag"""
+        version_url = "https://raw.githubusercontent.com/Giraffe801/CanvasNotes/main/version.txt"
+        
+        config = self._load_config()
+        cached_etag = config.get('update_etag')
+        cached_version = config.get('update_last_version')
+        headers = {'If-None-Match': cached_etag} if cached_etag and cached_version else None
+        
+        status, response_headers, body = self._http.get(version_url, headers=headers, timeout=5)
+        if status == 304:
+            return cached_version
+        if status != 200:
+            raise IOError(f"Unexpected HTTP status {status} from version check")
+        
+        latest_version = body.decode().strip()
+        if not latest_version:
+            raise ValueError("Empty version file")
+        etag = response_headers.get('ETag')
+        if etag:
+            self._update_config({'update_etag': etag, 'update_last_version': latest_version})
+        return latest_version
+    
     def check_for_updates_api(self):
         try:
-            version_url = "https://raw.githubusercontent.com/Giraffe801/CanvasNotes/main/version.txt"
-            with urllib.request.urlopen(version_url, timeout=5) as response:
-                latest_version = response.read().decode().strip()
+            latest_version = self._fetch_latest_version()
             
             return {
                 'has_update': latest_version != APP_VERSION,
@@ -1325,22 +1849,31 @@ class SimpleDashboardApp:
                     'files_checked': 0
                 }
             
-            # GitHub API to get latest commit info for src folder
-            api_url = "https://api.github.com/repos/Giraffe801/CanvasNotes/commits?path=src&per_page=1"
+            # If index.html is no longer the file we downloaded (e.g. the offline
+            # fallback page), it needs replacing regardless of the remote state
+            stored_sha256 = self._load_config().get('src_html_sha256')
+            if stored_sha256:
+                try:
+                    local_sha256 = hashlib.sha256((self.src_dir / 'index.html').read_bytes()).hexdigest()
+                except OSError:
+                    local_sha256 = None
+                if local_sha256 != stored_sha256:
+                    return {
+                        'needs_update': True,
+                        'reason': 'Local interface files differ from the last download',
+                        'files_checked': 1 if local_sha256 else 0
+                    }
             
-            request = urllib.request.Request(api_url)
-            with urllib.request.urlopen(request, timeout=10) as response:
-                commits = json.loads(response.read().decode())
+            # GitHub API to get latest commit info for src folder
+            latest_commit_sha = self._fetch_latest_src_commit()
             
-            if not commits:
+            if not latest_commit_sha:
                 return {
                     'needs_update': False,
                     'reason': 'Unable to check remote updates',
                     'files_checked': 0
                 }
             
-            latest_commit_sha = commits[0]['sha']
-            
             # Check if we have stored the last update commit
             stored_commit = self.get_stored_src_commit()
             
@@ -1364,30 +1897,46 @@ class SimpleDashboardApp:
                 'files_checked': 0
             }
     
+    def _fetch_latest_src_commit(self):
+        """Return the latest commit SHA touching src/, revalidating the cached answer with its ETag"""
+        api_url = "https://api.github.com/repos/Giraffe801/CanvasNotes/commits?path=src&per_page=1"
+        
+        config = self._load_config()
+        cached_etag = config.get('src_commit_etag')
+        cached_sha = config.get('src_remote_commit')
+        headers = {'If-None-Match': cached_etag} if cached_etag and cached_sha else None
+        
+        status, response_headers, body = self._http.get(api_url, headers=headers, timeout=10)
+        if status == 304:
+            # Not modified: no body, and GitHub does not count it against the rate limit
+            return cached_sha
+        if status != 200:
+            raise IOError(f"Unexpected HTTP status {status} from commit lookup")
+        
+        commits = _json_loads(body)
+        if not commits:
+            return None
+        
+        latest_commit_sha = commits[0]['sha']
+        etag = response_headers.get('ETag')
+        if etag:
+            self._update_config({'src_commit_etag': etag, 'src_remote_commit': latest_commit_sha})
+        return latest_commit_sha
+    
     def get_stored_src_commit(self):
         """Get the stored commit hash for src folder"""
         try:
-            config = {}
-            if self.config_file.exists():
-                with open(self.config_file, 'r') as f:
-                    config = json.load(f)
-            return config.get('src_commit_hash', '')
+            return self._load_config().get('src_commit_hash', '')
         except:
             return ''
     
     def store_src_commit(self, commit_hash):
         """Store the commit hash for src folder"""
         try:
-            config = {}
-            if self.config_file.exists():
-                with open(self.config_file, 'r') as f:
-                    config = json.load(f)
-            
-            config['src_commit_hash'] = commit_hash
-            config['src_last_updated'] = datetime.now().isoformat()
-            
-            with open(self.config_file, 'w') as f:
-                json.dump(config, f, indent=2)
+            self._update_config({
+                'src_commit_hash': commit_hash,
+                'src_last_updated': datetime.now().isoformat()
+            })
         except Exception as e:
             print(f"Failed to store src commit hash: {e}")
     
@@ -1401,18 +1950,15 @@ class SimpleDashboardApp:
             print("Updating HTML file...")
             
             # Get latest commit hash first
-            api_url = "https://api.github.com/repos/Giraffe801/CanvasNotes/commits?path=src&per_page=1"
-            request = urllib.request.Request(api_url)
-            with urllib.request.urlopen(request, timeout=10) as response:
-                commits = json.loads(response.read().decode())
-            
-            if commits:
-                latest_commit_sha = commits[0]['sha']
-            else:
-                latest_commit_sha = 'unknown'
+            latest_commit_sha = self._fetch_latest_src_commit() or 'unknown'
             
             # Download the updated HTML file
-            self.download_src_folder()
+            downloaded = self.download_src_folder()
+            self.clear_src_cache()
+            if not downloaded:
+                # Leave the stored commit alone so the next check still offers the update
+                print("HTML file update failed validation")
+                return False
             
             # Store the commit hash
             self.store_src_commit(latest_commit_sha)
@@ -1462,39 +2008,108 @@ class SimpleDashboardApp:
     def get_course_files(self, course_name):
         try:
             course_notes_dir = self.data_dir / "course_notes"
-            safe_course_name = "".join(c for c in course_name if c.isalnum() or c in (' ', '-', '_')).rstrip()
-            course_dir = course_notes_dir / safe_course_name
+            course_dir = course_notes_dir / _safe_course_name(course_name)
             
-            if not course_dir.exists():
+            # One directory scan replaces the exists() check and glob's listing + per-entry stats
+            try:
+                with os.scandir(course_dir) as it:
+                    entries = [entry for entry in it
+                               if os.path.normcase(entry.name).endswith('.txt')
+                               and entry.is_file(follow_symlinks=False)]
+            except FileNotFoundError:
                 return {}
             
             files = {}
-            for file_path in course_dir.glob("*.txt"):
+            to_read = []
+            for entry in entries:
+                try:
+                    st = entry.stat()
+                except OSError:
+                    files[entry.name] = ""
+                    continue
+                if st.st_size > _NOTE_MAX_BYTES:
+                    # Left out entirely: an empty placeholder could be saved back over the real file
+                    print(f"Skipping oversized note {entry.path} ({st.st_size} bytes)")
+                    continue
+                
+                stamp = (st.st_mtime_ns, st.st_size)
+                cached = self._notes_cache_get(entry.path, stamp)
+                if cached is not None:
+                    files[entry.name] = cached
+                else:
+                    files[entry.name] = ""  # keeps directory order; filled in below
+                    to_read.append((entry, stamp))
+            
+            def read(item):
+                entry, stamp = item
                 try:
-                    with open(file_path, 'r', encoding='utf-8') as f:
-                        files[file_path.name] = f.read()
-                except:
-                    files[file_path.name] = ""
+                    return _read_note_file(entry.path, stamp[1])
+                except Exception:
+                    return None
+            
+            # Overlap cold reads when there is more than one to do
+            texts = self._notes_pool.map(read, to_read) if len(to_read) > 1 else map(read, to_read)
+            for (entry, stamp), text in zip(to_read, texts):
+                if text is not None:
+                    self._notes_cache_put(entry.path, stamp, text)
+                    files[entry.name] = text
+            
+            # Forget notes that were deleted or renamed since the last scan
+            prefix = os.path.join(os.fspath(course_dir), '')
+            scanned = {entry.path for entry in entries}
+            with self._notes_lock:
+                stale = [path for path in self._notes_cache
+                         if path.startswith(prefix) and path not in scanned]
+                for path in stale:
+                    self._notes_cache_drop_locked(path)
             
             return files
         except Exception:
             return {}
     
+    def _notes_cache_get(self, path, stamp):
+        """Return the cached text for path if its (mtime_ns, size) stamp still matches."""
+        with self._notes_lock:
+            cached = self._notes_cache.get(path)
+            if not cached or cached[0] != stamp:
+                return None
+            self._notes_cache.move_to_end(path)
+            return cached[1]
+    
+    def _notes_cache_put(self, path, stamp, text):
+        """Cache decoded text for path, evicting the least recently used notes over the cap."""
+        with self._notes_lock:
+            self._notes_cache_drop_locked(path)
+            if len(text) > _NOTES_CACHE_MAX_CHARS:
+                return
+            self._notes_cache[path] = (stamp, text)
+            self._notes_cache_chars += len(text)
+            while self._notes_cache_chars > _NOTES_CACHE_MAX_CHARS:
+                _, (_, old) = self._notes_cache.popitem(last=False)
+                self._notes_cache_chars -= len(old)
+    
+    def _notes_cache_drop_locked(self, path):
+        """Remove path from the notes cache; caller holds _notes_lock."""
+        cached = self._notes_cache.pop(path, None)
+        if cached:
+            self._notes_cache_chars -= len(cached[1])
+    
     def save_course_file(self, course_name, filename, content):
         try:
             course_notes_dir = self.data_dir / "course_notes"
             course_notes_dir.mkdir(exist_ok=True)
             
-            safe_course_name = "".join(c for c in course_name if c.isalnum() or c in (' ', '-', '_')).rstrip()
-            course_dir = course_notes_dir / safe_course_name
+            course_dir = course_notes_dir / _safe_course_name(course_name)
             course_dir.mkdir(exist_ok=True)
             
             if not filename.endswith('.txt'):
                 filename += '.txt'
             
             file_path = course_dir / filename
-            with open(file_path, 'w', encoding='utf-8') as f:
-                f.write(content)
+            _write_file_atomic(file_path, content, encoding='utf-8')
+            # Coarse mtimes could hide a same-size rewrite, so don't rely on the stamp here
+            with self._notes_lock:
+                self._notes_cache_drop_locked(str(file_path))
             
             return True
         except Exception as e:
@@ -1516,37 +2131,120 @@ class SimpleDashboardApp:
             if hasattr(self, 'root'):
                 self.root.mainloop()
 
-    def load_config(self):
-        if self.config_file.exists():
+    def _load_config(self) -> Dict[str, Any]:
+        """Return the parsed config dict, re-reading the file only if its mtime changed"""
+        with self._config_lock:
+            if self._config_dirty and self._config_cache is not None:
+                # Unsaved changes in memory win over whatever is on disk
+                return self._config_cache
             try:
-                with open(self.config_file, 'r') as f:
-                    config = json.load(f)
-                    print(f"Loaded config from file: {config}")
-                    if config.get('canvas_url') and config.get('canvas_token'):
-                        print(f"Creating CanvasAPI with URL: {config['canvas_url']}")
-                        self.canvas_api = CanvasAPI(config['canvas_url'], config['canvas_token'])
-                        print("CanvasAPI created successfully")
-                    else:
-                        print("Config missing canvas_url or canvas_token")
-            except Exception as e:
-                print(f"Failed to load config: {e}")
-        else:
-            print(f"Config file does not exist: {self.config_file}")
+                mtime_ns = self.config_file.stat().st_mtime_ns
+            except FileNotFoundError:
+                mtime_ns = None
+            if self._config_cache is None or mtime_ns != self._config_mtime_ns:
+                data = b'{}'
+                if mtime_ns is not None:
+                    try:
+                        data = self.config_file.read_bytes()
+                    except FileNotFoundError:
+                        # Removed between the stat and the read
+                        mtime_ns = None
+                self._config_cache = self._parse_config(data)
+                self._config_mtime_ns = mtime_ns
+                # Derived views are rebuilt only here, i.e. when the file actually changed
+                if not self._hidden_dirty:
+                    self.hidden_courses = frozenset(self._config_cache.get('hidden_courses', ()))
+            return self._config_cache
+    
+    def _parse_config(self, data: bytes) -> Dict[str, Any]:
+        """Parse config file bytes; a corrupt or non-object file counts as empty"""
+        try:
+            config = _json_loads(data)
+        except ValueError as e:
+            log.warning("Ignoring unreadable config %s: %s", self.config_file, e)
+            return {}
+        if not isinstance(config, dict):
+            log.warning("Ignoring config %s: top level is not an object", self.config_file)
+            return {}
+        return config
+    
+    def _update_config(self, values: Dict[str, Any]):
+        """Merge values into the cached config and write it out.
+        
+        A write that follows the previous one within _CONFIG_FLUSH_INTERVAL is
+        deferred to a timer so bursts of updates reach the disk once.
+        """
+        with self._config_lock:
+            self._load_config().update(values)
+            self._config_dirty = True
+            wait = self._last_config_flush + _CONFIG_FLUSH_INTERVAL - time.monotonic()
+            if wait <= 0:
+                self._flush_config()
+            elif self._config_flush_timer is None:
+                self._config_flush_timer = threading.Timer(wait, self._flush_config_deferred)
+                self._config_flush_timer.daemon = True
+                self._config_flush_timer.start()
+    
+    def _flush_config_deferred(self):
+        try:
+            self._flush_config()
+        except Exception as e:
+            print(f"Failed to save config: {e}")
+    
+    def _flush_config(self):
+        """Write the cached config to disk if it has unsaved changes"""
+        with self._config_lock:
+            if self._config_flush_timer is not None:
+                self._config_flush_timer.cancel()
+                self._config_flush_timer = None
+            if not self._config_dirty:
+                return
+            _write_file_atomic(self.config_file, _json_dumps_bytes(self._config_cache))
+            self._config_mtime_ns = self.config_file.stat().st_mtime_ns
+            self._config_dirty = False
+            self._last_config_flush = time.monotonic()
+
+    def load_config(self):
+        try:
+            config = self._load_config()
+            if not config:
+                log.debug("Config file does not exist or is empty: %s", self.config_file)
+                return
+            # Keys only, so the Canvas token never ends up in a log
+            log.debug("Loaded config from file with keys: %s", sorted(config))
+            if config.get('canvas_url') and config.get('canvas_token'):
+                log.debug("Creating CanvasAPI with URL: %s", config['canvas_url'])
+                self.canvas_api = CanvasAPI(config['canvas_url'], config['canvas_token'],
+                                            cache_dir=self.data_dir)
+                log.debug("CanvasAPI created successfully")
+            else:
+                log.debug("Config missing canvas_url or canvas_token")
+        except Exception as e:
+            log.warning("Failed to load config: %s", e)
+
+    @staticmethod
+    def _read_json_file_mapped(path):
+        """Parse a JSON file, letting orjson read it straight from a memory map when possible.
+        
+        Returns None for an empty file. The map is skipped on Windows, where an open
+        mapping would make a concurrent os.replace of the file fail.
+        """
+        with open(path, 'rb') as f:
+            size = os.fstat(f.fileno()).st_size
+            if size == 0:
+                return None
+            if HAS_ORJSON and os.name != 'nt':
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    view = memoryview(mm)
+                    try:
+                        return orjson.loads(view)
+                    finally:
+                        view.release()
+            return _json_loads(f.read())
 
     def save_courses_to_cache(self, courses: List[Course]):
         try:
-            courses_data = []
-            for course in courses:
-                course_dict = {
-                    'id': course.id,
-                    'name': course.name,
-                    'course_code': course.course_code,
-                    'workflow_state': course.workflow_state,
-                    'term': course.term,
-                    'start_at': course.start_at,
-                    'end_at': course.end_at
-                }
-                courses_data.append(course_dict)
+            courses_data = list(map(Course.as_dict, courses))
             
             cache_data = {
                 'courses': courses_data,
@@ -1554,64 +2252,74 @@ class SimpleDashboardApp:
                 'total_courses': len(courses_data)
             }
             
-            with open(self.data_file, 'w') as f:
-                json.dump(cache_data, f, indent=2)
+            _write_file_atomic(self.data_file, _json_dumps_bytes(cache_data, indent=True))
                 
         except Exception as e:
             print(f"Failed to save courses to cache: {e}")
     
     def load_cached_courses(self):
-        if not self.data_file.exists():
-            return
-            
         try:
-            with open(self.data_file, 'r') as f:
-                cache_data = json.load(f)
-                
-            courses_data = cache_data.get('courses', [])
-            self.courses = []
-            
-            for course_dict in courses_data:
-                course = Course(
-                    id=course_dict.get('id'),
-                    name=course_dict.get('name', 'Unknown Course'),
-                    course_code=course_dict.get('course_code', ''),
-                    workflow_state=course_dict.get('workflow_state', 'available'),
-                    term=course_dict.get('term'),
-                    start_at=course_dict.get('start_at'),
-                    end_at=course_dict.get('end_at')
-                )
-                self.courses.append(course)
+            try:
+                cache_data = self._read_json_file_mapped(self.data_file)
+            except FileNotFoundError:
+                return
+            if cache_data is None:
+                return
+            
+            courses = list(map(Course.from_dict, cache_data.get('courses', [])))
+            
+            with self._courses_lock:
+                self.courses = courses
                 
         except Exception as e:
             print(f"Failed to load cached courses: {e}")
 
     def load_hidden_courses(self):
-        try:
-            if self.config_file.exists():
-                with open(self.config_file, 'r') as f:
-                    config = json.load(f)
-                    hidden_list = config.get('hidden_courses', [])
-                    self.hidden_courses = set(hidden_list)
-            else:
-                self.hidden_courses = set()
-        except Exception as e:
-            print(f"Failed to load hidden courses: {e}")
-            self.hidden_courses = set()
+        """Make sure hidden_courses reflects the config; _load_config keeps it current from then on"""
+        with self._config_lock:
+            try:
+                self._load_config()
+            except Exception as e:
+                print(f"Failed to load hidden courses: {e}")
+                self.hidden_courses = frozenset()
+            self._hidden_dirty = False
+
+    def set_hidden_courses(self, course_ids):
+        """Replace the hidden course set and persist it if it changed"""
+        hidden = frozenset(course_ids)
+        # Same lock as save_hidden_courses, so a change can't slip between its snapshot and flag reset
+        with self._config_lock:
+            if hidden != self.hidden_courses:
+                self.hidden_courses = hidden
+                self._hidden_dirty = True
+                self._schedule_hidden_save()
+
+    def _schedule_hidden_save(self):
+        """Save the hidden set once toggling has been quiet for _CONFIG_FLUSH_INTERVAL"""
+        with self._config_lock:
+            if self._hidden_save_timer is not None:
+                self._hidden_save_timer.cancel()
+            self._hidden_save_timer = threading.Timer(_CONFIG_FLUSH_INTERVAL, self.save_hidden_courses)
+            self._hidden_save_timer.daemon = True
+            self._hidden_save_timer.start()
 
     def save_hidden_courses(self):
-        try:
-            config = {}
-            if self.config_file.exists():
-                with open(self.config_file, 'r') as f:
-                    config = json.load(f)
-            
-            config['hidden_courses'] = list(self.hidden_courses)
-            
-            with open(self.config_file, 'w') as f:
-                json.dump(config, f, indent=2)
-        except Exception as e:
-            print(f"Failed to save hidden courses: {e}")
+        with self._config_lock:
+            if self._hidden_save_timer is not None:
+                self._hidden_save_timer.cancel()
+                self._hidden_save_timer = None
+            if not self._hidden_dirty:
+                return
+            # Pick up any on-disk change while still dirty, so the re-parse can't replace our set
+            self._load_config()
+            # Snapshot and clear together; a later set_hidden_courses marks it dirty again
+            hidden = list(self.hidden_courses)
+            self._hidden_dirty = False
+            try:
+                self._update_config({'hidden_courses': hidden})
+            except Exception as e:
+                self._hidden_dirty = True
+                print(f"Failed to save hidden courses: {e}")
 
     def on_closing(self):
         """Handle application closing"""
@@ -1622,13 +2330,20 @@ class SimpleDashboardApp:
             self.root.destroy()
 
     def check_for_updates_startup(self):
-        """Check for updates on startup"""
+        """Check for updates on startup without holding up the window"""
+        self._run_in_background(self._check_updates_if_online, (), self._on_startup_updates_checked)
+    
+    def _check_updates_if_online(self):
+        """Network half of the startup check; returns None when offline"""
         if not self.check_internet_connection():
-            return
-        
+            return None
+        return self.check_all_updates()
+    
+    def _on_startup_updates_checked(self, future):
         try:
-            # Get comprehensive update info
-            update_info = self.check_all_updates()
+            update_info = future.result()
+            if update_info is None:
+                return
             
             # Handle app updates
             app_info = update_info.get('app', {})
@@ -1647,11 +2362,22 @@ class SimpleDashboardApp:
 
     def check_internet_connection(self):
         """Check if internet connection is available"""
-        try:
-            with urllib.request.urlopen('http://www.google.com', timeout=3):
+        # Behind a proxy direct connects are typically blocked; the update check goes
+        # through the proxy (like urlopen did), so reaching the proxy is what matters
+        proxy = KeepAliveHTTPClient._proxy_for(urllib.parse.urlsplit("https://api.github.com/"))
+        if proxy is not None:
+            probes = ((proxy.hostname, proxy.port or 80),)
+        else:
+            # A bare TCP connect skips DNS and HTTP for the common case; networks that
+            # block outside DNS servers still get a chance via the host we actually use
+            probes = _CONNECTIVITY_PROBES
+        for address in probes:
+            try:
+                socket.create_connection(address, timeout=1.0).close()
                 return True
-        except:
-            return False
+            except OSError:
+                continue
+        return False
 
     def show_update_notification(self, latest_version):
         """Show update notification"""
@@ -1662,7 +2388,7 @@ class SimpleDashboardApp:
                 f"Version {latest_version} is available. Would you like to update?"
             )
             if result:
-                self.start_update_process(latest_version)
+                self._io_pool.submit(self.start_update_process, latest_version)
         else:
             # Webview mode or no GUI - just print for now
             print(f"Update Available: Version {latest_version} is available")
@@ -1677,18 +2403,91 @@ class SimpleDashboardApp:
                 "New web interface files are available. Would you like to update them?"
             )
             if result:
-                success = self.update_src_folder()
-                if success:
-                    messagebox.showinfo("Update Complete", "Web interface files updated successfully!")
-                else:
-                    messagebox.showerror("Update Failed", "Failed to update web interface files.")
+                self._run_in_background(self.update_src_folder, (), self._on_notified_src_updated)
         else:
             # Webview mode or no GUI - just print for now
             print("Interface Update Available: New web interface files are available")
             print("Update can be triggered via web interface")
+    
+    def _on_notified_src_updated(self, future):
+        try:
+            success = future.result()
+        except Exception:
+            success = False
+        if success:
+            messagebox.showinfo("Update Complete", "Web interface files updated successfully!")
+        else:
+            messagebox.showerror("Update Failed", "Failed to update web interface files.")
 
+    def download_file(self, url, dest_path, parts=4):
+        """Download url to dest_path, fetching disjoint byte ranges in parallel when the server allows it"""
+        # Probe with a one-byte range GET rather than HEAD: urllib turns a redirected HEAD into
+        # a GET of the whole file. A 206 carries the total size in Content-Range.
+        probe = urllib.request.Request(url, headers={'Range': 'bytes=0-0'})
+        with urllib.request.urlopen(probe, timeout=30) as response:
+            if response.status != 206:
+                # No range support: this response already is the whole file
+                with open(dest_path, "wb", buffering=1024 * 1024) as out_file:
+                    shutil.copyfileobj(response, out_file, 1024 * 1024)
+                return
+            # Release downloads redirect to a CDN; ask it directly for the ranges
+            final_url = response.geturl()
+            total = response.headers.get('Content-Range', '').rpartition('/')[2]
+            response.read()
+        size = int(total) if total.isdigit() else 0
+        
+        if size < parts * _RANGE_PART_MIN_SIZE:
+            # Stream to disk in 1 MiB chunks rather than holding the whole file in memory
+            with urllib.request.urlopen(final_url, timeout=30) as response, \
+                    open(dest_path, "wb", buffering=1024 * 1024) as out_file:
+                shutil.copyfileobj(response, out_file, 1024 * 1024)
+            return
+        
+        # Preallocate so every worker can write its slice through its own handle
+        with open(dest_path, "wb") as out_file:
+            out_file.truncate(size)
+        
+        def fetch_range(start, end):
+            request = urllib.request.Request(final_url, headers={'Range': f'bytes={start}-{end}'})
+            with urllib.request.urlopen(request, timeout=30) as response, \
+                    open(dest_path, "r+b", buffering=1024 * 1024) as out_file:
+                if response.status != 206:
+                    raise IOError(f"Server ignored range request (HTTP {response.status})")
+                out_file.seek(start)
+                shutil.copyfileobj(response, out_file, 1024 * 1024)
+                if out_file.tell() != end + 1:
+                    raise IOError(f"Short read for bytes {start}-{end}")
+        
+        step = -(-size // parts)
+        with ThreadPoolExecutor(max_workers=parts, thread_name_prefix="download") as pool:
+            futures = [pool.submit(fetch_range, start, min(start + step, size) - 1)
+                       for start in range(0, size, step)]
+            for future in futures:
+                future.result()
+    
+    def _call_on_ui(self, func, *args):
+        """Run func on the Tk thread when there is a Tk window, otherwise call it directly"""
+        if getattr(self, 'root', None):
+            self.root.after(0, func, *args)
+        else:
+            func(*args)
+    
+    def _close_for_update(self):
+        if getattr(self, 'root', None):
+            self.root.destroy()
+    
+    def _report_update_failure(self, error):
+        if hasattr(self, 'root'):
+            messagebox.showerror("Update Failed", f"Update failed: {error}")
+        else:
+            print(f"Update failed: {error}")
+    
     def start_update_process(self, latest_version):
-        """Start the update process - downloads new exe and HTML if applicable"""
+        """Start the update process - downloads new exe and HTML if applicable.
+        
+        Blocking; run it on a worker thread. Only closing the window and the error
+        dialog are handed back to the Tk thread.
+        """
         try:
             # First update the HTML file if not in dev mode
             if not DEV_MODE:
@@ -1704,32 +2503,28 @@ class SimpleDashboardApp:
             
             tmp_dir = tempfile.gettempdir()
             new_exe_path = os.path.join(tmp_dir, "canvas_dashboard_new.exe")
-            with urllib.request.urlopen(exe_url) as response, open(new_exe_path, "wb") as out_file:
-                out_file.write(response.read())
+            self.download_file(exe_url, new_exe_path)
             old_exe = sys.argv[0]
-            bat_path = os.path.join(tmp_dir, "update_canvas_dashboard.bat")
-            with open(bat_path, "w") as bat:
-                bat.write(f"""
-@echo off
-timeout /t 2 >nul
-move /y "{new_exe_path}" "{old_exe}"
-start "" "{old_exe}"
-del "%~f0"
-""")
-            os.startfile(bat_path)
-            if hasattr(self, 'root') and self.root:
-                self.root.destroy()
+            # One detached cmd swaps the exe in once we have exited; no .bat file needed.
+            # ping rather than timeout, which refuses to run without a console.
+            import subprocess
+            subprocess.Popen(
+                f'cmd /c "ping -n 3 127.0.0.1 >nul & move /y "{new_exe_path}" "{old_exe}" >nul & start "" "{old_exe}""',
+                creationflags=subprocess.DETACHED_PROCESS | subprocess.CREATE_NEW_PROCESS_GROUP,
+                close_fds=True
+            )
+            self._call_on_ui(self._close_for_update)
         except Exception as e:
-            if hasattr(self, 'root'):
-                messagebox.showerror("Update Failed", f"Update failed: {e}")
-            else:
-                print(f"Update failed: {e}")
+            self._call_on_ui(self._report_update_failure, e)
 
 
 def main():
     dev_logger = None
     error_logger = None
     
+    # Debug tracing is only wanted in dev mode; warnings still reach stderr otherwise
+    log.setLevel(logging.DEBUG if DEV_MODE else logging.WARNING)
+    
     # Initialize dev mode logging if enabled
     if DEV_MODE:
         try:
@@ -1739,11 +2534,15 @@ def main():
             log_file_path = src_dir / "canvas_dashboard.log"
             
             dev_logger = DevLogger(log_file_path)
-            error_logger = DevErrorLogger(dev_logger.log_file, sys.stderr)
+            error_logger = DevErrorLogger(dev_logger, sys.stderr)
             
             sys.stdout = dev_logger
             sys.stderr = error_logger
             
+            log_handler = logging.StreamHandler(sys.stdout)
+            log_handler.setFormatter(logging.Formatter("%(message)s"))
+            log.addHandler(log_handler)
+            
             print(f"DEV MODE: Logging enabled to {log_file_path}")
             
         except Exception as e: